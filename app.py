@@ -1,7 +1,21 @@
+import numpy as np
 import streamlit as st
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
-from typing import List, Optional, Set, Tuple
+from typing import Optional, Tuple
+
+from src.simulation_v0_3 import _simulate_v03_kernel
+
+# Prefer a prebuilt kernel: Numba AOT (`python -m src._simulate_compiled`), then Cython
+# (`python setup.py build_ext --inplace`). Otherwise the njit kernel compiles on the first
+# rerun and is cached on disk (or runs as plain Python without Numba).
+try:
+    from src.simulate_v03_aot import simulate_v03 as _kernel
+except ImportError:
+    try:
+        from src._simulate_cy import simulate_v03_cy as _kernel
+    except ImportError:
+        _kernel = _simulate_v03_kernel
 
 # -----------------------------
 # Core baseline constants (from your model)
@@ -11,7 +25,7 @@ START_YEAR_DEFAULT = 2000
 HORIZON_DEFAULT = 200
 
 # El Niño years (can be toggled ON/OFF as a block)
-ELNINO_YEARS: Set[int] = {2015, 2016, 2023, 2024}
+ELNINO_YEARS = np.array([2015, 2016, 2023, 2024], dtype=np.int64)
 
 THRESHOLDS = {
     "20% loss (80% remaining)": 0.80,
@@ -19,13 +33,14 @@ THRESHOLDS = {
 }
 
 
-def first_crossing_year(years: List[int], series: List[float], threshold_value: float) -> Optional[int]:
-    for y, v in zip(years, series):
-        if v <= threshold_value:
-            return y
-    return None
+def first_crossing_year(years: np.ndarray, series: np.ndarray, threshold_value: float) -> Optional[int]:
+    crossed = np.asarray(series) <= threshold_value
+    if not crossed.any():
+        return None
+    return int(years[np.argmax(crossed)])
 
 
+@st.cache_data(max_entries=128, show_spinner=False)
 def simulate_v03(
     start_year: int,
     horizon: int,
@@ -43,49 +58,59 @@ def simulate_v03(
     elnino_mult: float,
     rho_recovery: float,
     w_degraded_target: float,
-) -> Tuple[List[int], List[float], List[float], List[float]]:
-    years = [start_year + t for t in range(horizon + 1)]
-    intact = [float(F0_intact)]
-    degraded = [float(F0_degraded)]
-    total = [float(F0_intact + F0_degraded)]
-
-    for t in range(horizon):
-        y = years[t]
-        F_int = intact[-1]
-        F_deg = degraded[-1]
-        F_tot = max(F_int + F_deg, 1.0)
-
-        # Human conversion
-        post_mult = post_accord_mult if (post_accord_on and y >= post_accord_start) else 0.0
-        D_human = (D_base * enforcement_factor) * (1.0 + post_mult)
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    years = start_year + np.arange(horizon + 1)
+    # uint8 view so every kernel build accepts it (Cython memoryviews can't take np.bool_)
+    elnino_mask = (elnino_on & np.isin(years, ELNINO_YEARS)).view(np.uint8)
+
+    state = _kernel(
+        horizon,
+        float(F0_intact),
+        float(F0_degraded),
+        float(D_base),
+        float(enforcement_factor),
+        bool(post_accord_on),
+        post_accord_start - start_year,
+        float(post_accord_mult),
+        float(fire_base),
+        float(climate_stress),
+        float(alpha_vuln),
+        elnino_mask,
+        float(elnino_mult),
+        float(rho_recovery),
+        float(w_degraded_target),
+    )
+    intact, degraded, total = state.T  # column views into the (horizon + 1, 3) state
 
-        # Allocate conversion pressure (small preference to degraded, but not enough to erase it)
-        convert_deg = min(F_deg, D_human * w_degraded_target)
-        remaining = D_human - convert_deg
-        convert_int = min(F_int, max(remaining, 0.0))
-
-        # Fire-driven degradation (reinforcing)
-        deg_share = F_deg / F_tot
-        vuln_factor = 1.0 + alpha_vuln * deg_share
+    return years, intact, degraded, total
 
-        eln = elnino_mult if (elnino_on and y in ELNINO_YEARS) else 0.0
-        fire_pressure = (fire_base * climate_stress) * vuln_factor * (1.0 + eln)
 
-        degrade = min(F_int - convert_int, max(fire_pressure, 0.0))
-        degrade = max(degrade, 0.0)
+@st.cache_data(max_entries=128, show_spinner=False)
+def derive_metrics(
+    years: np.ndarray,
+    degraded: np.ndarray,
+    total: np.ndarray,
+    f0_total: float,
+) -> Tuple[np.ndarray, np.ndarray, float, Optional[int], Optional[int]]:
+    deforested = np.maximum(f0_total - total, 0.0)
+    degraded_pct = degraded / np.maximum(total, 1.0) * 100.0
+    peak_pct = float(degraded_pct.max())
 
-        # Recovery (balancing)
-        recover = min(F_deg - convert_deg, rho_recovery * F_deg)
-        recover = max(recover, 0.0)
+    # Threshold years
+    thr_80 = first_crossing_year(years, total, 0.80 * f0_total)
+    thr_75 = first_crossing_year(years, total, 0.75 * f0_total)
 
-        next_int = F_int - convert_int - degrade + recover
-        next_deg = F_deg - convert_deg + degrade - recover
+    return deforested, degraded_pct, peak_pct, thr_80, thr_75
 
-        intact.append(max(next_int, 0.0))
-        degraded.append(max(next_deg, 0.0))
-        total.append(max(next_int + next_deg, 0.0))
 
-    return years, intact, degraded, total
+def get_figure(key: str) -> Figure:
+    """Returns this session's persisted figure for `key`, cleared for redrawing."""
+    figures = st.session_state.setdefault("_figures", {})
+    if key not in figures:
+        figures[key] = Figure()
+    fig = figures[key]
+    fig.clear()
+    return fig
 
 
 # -----------------------------
@@ -181,63 +206,62 @@ years, intact, degraded, total = simulate_v03(
     w_degraded_target=float(w_deg),
 )
 
-# Derived metrics
-deforested = [max(f0_total - t, 0.0) for t in total]
-degraded_pct = [(d / max(t, 1.0)) * 100.0 for d, t in zip(degraded, total)]
-
-# Threshold years
-thr_80 = first_crossing_year(years, total, 0.80 * f0_total)
-thr_75 = first_crossing_year(years, total, 0.75 * f0_total)
+# Derived metrics and threshold years
+deforested, degraded_pct, peak_pct, thr_80, thr_75 = derive_metrics(years, degraded, total, float(f0_total))
 
 col1, col2, col3 = st.columns(3)
 col1.metric("80% remaining threshold year", thr_80 if thr_80 else "Not crossed")
 col2.metric("75% remaining threshold year", thr_75 if thr_75 else "Not crossed")
-col3.metric("Peak degraded (%)", f"{max(degraded_pct):.2f}%")
+col3.metric("Peak degraded (%)", f"{peak_pct:.2f}%")
 
 st.divider()
 
 # Plot 1: Intact + Total
 st.subheader("Forest Remaining (Total vs Intact)")
-fig1 = plt.figure()
-plt.plot(years, total, linewidth=2, label="Total forest (intact + degraded)")
-plt.plot(years, intact, linewidth=2, label="Intact forest")
-plt.xlabel("Year")
-plt.ylabel("Area (hectares)")
-plt.grid(True, alpha=0.3)
-plt.legend()
-st.pyplot(fig1)
+fig1 = get_figure("fig1")
+ax = fig1.add_subplot(111)
+ax.plot(years, total, linewidth=2, label="Total forest (intact + degraded)")
+ax.plot(years, intact, linewidth=2, label="Intact forest")
+ax.set_xlabel("Year")
+ax.set_ylabel("Area (hectares)")
+ax.grid(True, alpha=0.3)
+ax.legend()
+st.pyplot(fig1, clear_figure=True)
 
 # Plot 2: Degraded only + % degraded
 st.subheader("Degraded Forest (Leading Indicator)")
 c1, c2 = st.columns(2)
 
 with c1:
-    fig2 = plt.figure()
-    plt.plot(years, degraded, linewidth=2, linestyle="--", label="Degraded forest (ha)")
-    plt.xlabel("Year")
-    plt.ylabel("Area (hectares)")
-    plt.grid(True, alpha=0.3)
-    plt.legend()
-    st.pyplot(fig2)
+    fig2 = get_figure("fig2")
+    ax = fig2.add_subplot(111)
+    ax.plot(years, degraded, linewidth=2, linestyle="--", label="Degraded forest (ha)")
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Area (hectares)")
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    st.pyplot(fig2, clear_figure=True)
 
 with c2:
-    fig3 = plt.figure()
-    plt.plot(years, degraded_pct, linewidth=2, linestyle="--", label="Degraded (% of total)")
-    plt.xlabel("Year")
-    plt.ylabel("Percent (%)")
-    plt.grid(True, alpha=0.3)
-    plt.legend()
-    st.pyplot(fig3)
+    fig3 = get_figure("fig3")
+    ax = fig3.add_subplot(111)
+    ax.plot(years, degraded_pct, linewidth=2, linestyle="--", label="Degraded (% of total)")
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Percent (%)")
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    st.pyplot(fig3, clear_figure=True)
 
 # Plot 3: Deforested derived
 st.subheader("Deforested (Derived)")
-fig4 = plt.figure()
-plt.plot(years, deforested, linewidth=2, label="Deforested (derived) = initial - total remaining")
-plt.xlabel("Year")
-plt.ylabel("Area (hectares)")
-plt.grid(True, alpha=0.3)
-plt.legend()
-st.pyplot(fig4)
+fig4 = get_figure("fig4")
+ax = fig4.add_subplot(111)
+ax.plot(years, deforested, linewidth=2, label="Deforested (derived) = initial - total remaining")
+ax.set_xlabel("Year")
+ax.set_ylabel("Area (hectares)")
+ax.grid(True, alpha=0.3)
+ax.legend()
+st.pyplot(fig4, clear_figure=True)
 
 st.divider()
 st.markdown(
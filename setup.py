@@ -0,0 +1,15 @@
+"""
+Optional native build of the V0.3 kernel (Cython).
+
+    python setup.py build_ext --inplace
+
+Produces src/_simulate_cy.*.so, which app.py picks up when present.
+"""
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+setup(
+    name="amazon-deforestation-system-simulation",
+    ext_modules=cythonize([Extension("src._simulate_cy", ["src/_simulate_cy.pyx"])]),
+)
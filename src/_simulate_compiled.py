@@ -0,0 +1,65 @@
+"""
+Ahead-of-time build of the V0.3 kernel (numba.pycc).
+
+Build once from the repository root:
+
+    python -m src._simulate_compiled
+
+This writes src/simulate_v03_aot.*.so. app.py imports it when it
+exists, so the dashboard's first run skips JIT compilation; otherwise
+it falls back to the njit kernel in simulation_v0_3.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from src.simulation_v0_3 import _simulate_v03_kernel
+
+cc = CC("simulate_v03_aot")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export("simulate_v03", "f8[:, ::1](i8, f8, f8, f8, f8, b1, i8, f8, f8, f8, f8, u1[:], f8, f8, f8)")
+def simulate_v03(
+    horizon,
+    F0_int,
+    F0_deg,
+    D_base,
+    enforcement_factor,
+    post_accord_on,
+    post_accord_start_offset,
+    post_accord_mult,
+    fire_base,
+    climate_stress,
+    alpha_vuln,
+    elnino_mask,
+    elnino_mult,
+    rho_recovery,
+    w_degraded_target,
+):
+    """
+    Same arguments and (horizon + 1, 3) state result as _simulate_v03_kernel,
+    with elnino_mask as uint8 (as app.py passes it).
+    """
+    return _simulate_v03_kernel(
+        horizon,
+        F0_int,
+        F0_deg,
+        D_base,
+        enforcement_factor,
+        post_accord_on,
+        post_accord_start_offset,
+        post_accord_mult,
+        fire_base,
+        climate_stress,
+        alpha_vuln,
+        elnino_mask,
+        elnino_mult,
+        rho_recovery,
+        w_degraded_target,
+    )
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,91 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython build of the V0.3 kernel, for environments without Numba.
+
+Build in place from the repository root:
+
+    python setup.py build_ext --inplace
+
+Mirrors simulation_v0_3._simulate_v03_kernel step for step, including the
+(horizon + 1, 3) state result; eln_mask is the El Niño mask viewed as uint8
+(np.bool_ arrays can't back a typed memoryview directly).
+"""
+
+import numpy as np
+
+
+cpdef object simulate_v03_cy(
+    int horizon,
+    double F0_int,
+    double F0_deg,
+    double D_base,
+    double enforcement_factor,
+    bint post_accord_on,
+    int post_start_offset,
+    double post_mult,
+    double fire_base,
+    double climate,
+    double alpha,
+    const unsigned char[::1] eln_mask,
+    double eln_mult,
+    double rho,
+    double w_deg,
+):
+    state_arr = np.empty((horizon + 1, 3), dtype=np.float64)
+    cdef double[:, ::1] state = state_arr
+
+    cdef double F_int = F0_int
+    cdef double F_deg = F0_deg
+    cdef double F_tot, D_human, convert_deg, remaining, convert_int
+    cdef double deg_share, vuln_factor, eln, fire_pressure, degrade, recover
+    cdef double next_int, next_deg, next_tot
+    cdef int t
+
+    # Loop-invariant setup, as in the Numba kernel
+    cdef int post_start = post_start_offset if post_accord_on else horizon + 1
+    cdef double D_pre = D_base * enforcement_factor
+    cdef double D_post = D_pre * (1.0 + post_mult)
+    cdef double fire_scaled = fire_base * climate
+
+    state[0, 0] = F0_int
+    state[0, 1] = F0_deg
+    state[0, 2] = F0_int + F0_deg
+
+    for t in range(horizon):
+        F_tot = F_int + F_deg
+        if F_tot < 1.0:
+            F_tot = 1.0
+
+        # Human conversion
+        D_human = D_post if t >= post_start else D_pre
+
+        # Allocate conversion pressure: small preference to degraded (but not enough to erase it)
+        convert_deg = min(F_deg, D_human * w_deg)
+        remaining = D_human - convert_deg
+        convert_int = min(F_int, max(remaining, 0.0))
+
+        # Fire-driven degradation (reinforcing)
+        deg_share = F_deg / F_tot
+        vuln_factor = 1.0 + alpha * deg_share
+
+        eln = eln_mult if eln_mask[t] else 0.0
+        fire_pressure = fire_scaled * vuln_factor * (1.0 + eln)
+
+        # min of two non-negatives (convert_int <= F_int), so no extra clamp needed
+        degrade = min(F_int - convert_int, max(fire_pressure, 0.0))
+
+        # Recovery (balancing); convert_deg <= F_deg, so this is non-negative too
+        recover = min(F_deg - convert_deg, rho * F_deg)
+
+        next_int = F_int - convert_int - degrade + recover
+        next_deg = F_deg - convert_deg + degrade - recover
+
+        # Safety net against rounding below zero
+        next_tot = next_int + next_deg
+        F_int = next_int if next_int > 0.0 else 0.0
+        F_deg = next_deg if next_deg > 0.0 else 0.0
+        state[t + 1, 0] = F_int
+        state[t + 1, 1] = F_deg
+        state[t + 1, 2] = next_tot if next_tot > 0.0 else 0.0
+
+    return state_arr
@@ -19,7 +19,8 @@ from typing import Dict, List, Tuple
 import os
 
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+import numpy as np
 
 
 @dataclass
@@ -33,14 +34,11 @@ class Scenario:
 
 def simulate(s: Scenario) -> Tuple[List[int], List[float]]:
     """Returns (calendar_years, forest_series)."""
-    years = [s.start_year + t for t in range(s.years + 1)]
-    forest = [float(s.F0)]
+    t = np.arange(s.years + 1)
+    forest = np.maximum(s.F0 - s.D * t, 0.0)  # R_t = 0 in V0.1, so F_t = F0 - D*t
+    years = (s.start_year + t).tolist()
 
-    for _ in range(s.years):
-        next_F = forest[-1] - s.D  # R_t = 0 in V0.1
-        forest.append(max(next_F, 0.0))
-
-    return years, forest
+    return years, forest.tolist()
 
 
 def crossing_year(start_year: int, F0: float, D: float, frac_remaining: float) -> int:
@@ -86,40 +84,48 @@ def main() -> None:
         results[s.name] = simulate(s)
 
     # --- Print threshold crossing years ---
+    # Same closed form as crossing_year, broadcast over (scenario, threshold)
+    F0s = np.array([s.F0 for s in scenarios], dtype=np.float64)
+    Ds = np.array([s.D for s in scenarios], dtype=np.float64)
+    starts = np.array([s.start_year for s in scenarios], dtype=np.int64)
+    fracs = np.array(list(thresholds.values()))
+
+    thresholds_mat = fracs[None, :] * F0s[:, None]
+    t_cross = np.ceil((F0s[:, None] - thresholds_mat) / Ds[:, None]).astype(np.int64)
+    years_cross = starts[:, None] + np.maximum(t_cross, 0)
+
     print("\n=== Threshold Crossing Years (V0.1, R=0) ===")
-    for s in scenarios:
+    for i, s in enumerate(scenarios):
         print(f"\nScenario: {s.name}")
-        for label, frac in thresholds.items():
-            y = crossing_year(s.start_year, s.F0, s.D, frac)
-            print(f"  {label}: {y}")
+        for j, label in enumerate(thresholds):
+            print(f"  {label}: {years_cross[i, j]}")
 
     # --- Plot ---
-    plt.figure(figsize=(11, 5))
+    fig = Figure(figsize=(11, 5))
+    ax = fig.add_subplot(111)
 
     for s in scenarios:
         years, forest = results[s.name]
-        plt.plot(years, forest, linewidth=2, label=s.name)
+        ax.plot(years, forest, linewidth=2, label=s.name)
 
     # Draw threshold lines
     for label, frac in thresholds.items():
         thr = frac * F0
-        plt.axhline(thr, linestyle="--")
-        plt.text(start_year + 1, thr, f"  {label}", va="bottom")
+        ax.axhline(thr, linestyle="--")
+        ax.text(start_year + 1, thr, f"  {label}", va="bottom")
 
-    plt.title("Colombian Amazon — Forest Remaining Over Time (V0.1, No Regeneration)")
-    plt.xlabel("Year")
-    plt.ylabel("Forest remaining (hectares)")
-    plt.grid(True, alpha=0.3)
-    plt.legend()
+    ax.set_title("Colombian Amazon — Forest Remaining Over Time (V0.1, No Regeneration)")
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Forest remaining (hectares)")
+    ax.grid(True, alpha=0.3)
+    ax.legend()
 
     # Ensure outputs directory exists
     os.makedirs("outputs", exist_ok=True)
 
     # Save figure
-    plt.tight_layout()
-    plt.savefig("outputs/forest_remaining_v0_1.png", dpi=200)
-
-    plt.close()
+    fig.tight_layout()
+    fig.savefig("outputs/forest_remaining_v0_1.png", dpi=100)
 
 
 if __name__ == "__main__":
@@ -28,7 +28,8 @@ Outputs:
 import os
 from typing import Dict, List, Optional, Set, Tuple
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+import numpy as np
 
 
 # -----------------------------
@@ -88,42 +89,34 @@ def simulate_channelized(
       D_human_series: realized human deforestation each year (len = horizon)
       D_fire_series: realized fire loss each year (len = horizon)
     """
-    years = [start_year + t for t in range(years_horizon + 1)]
-    forest = [float(F0)]
+    years_arr = start_year + np.arange(years_horizon + 1)
+    y_t = years_arr[:-1]  # year at the start of each step
 
-    D_human_series: List[float] = []
-    D_fire_series: List[float] = []
+    # --- HUMAN component (post-accord regime shift) ---
+    post_mask = post_accord_on & (y_t >= POST_ACCORD_START)
+    D_human_arr = D_base_human * np.where(post_mask, 1.0 + POST_ACCORD_MULT_HUMAN, 1.0)
 
-    for t in range(years_horizon):
-        y = years[t]
+    # --- FIRE component (pulse + El Niño multiplier ONLY on fires) ---
+    fire_mask = fires_on & np.isin(y_t, list(FIRE_YEARS))
+    eln_mask = elnino_on & np.isin(y_t, list(ELNINO_YEARS))
+    D_fire_arr = np.where(fire_mask, FIRE_EXTRA_HA, 0.0) * np.where(eln_mask, 1.0 + ELNINO_MULT_FIRE, 1.0)
 
-        # --- HUMAN component (post-accord regime shift) ---
-        m_post = POST_ACCORD_MULT_HUMAN if (post_accord_on and y >= POST_ACCORD_START) else 0.0
-        D_human = D_base_human * (1.0 + m_post)
+    # No feedback and regeneration still 0 in V0.2, so the stock is F0 minus cumulative loss
+    forest_arr = np.concatenate(([float(F0)], np.maximum(F0 - np.cumsum(D_human_arr + D_fire_arr), 0.0)))
 
-        # --- FIRE component (pulse + El Niño multiplier ONLY on fires) ---
-        D_fire_base = FIRE_EXTRA_HA if (fires_on and y in FIRE_YEARS) else 0.0
-        m_eln_fire = ELNINO_MULT_FIRE if (elnino_on and y in ELNINO_YEARS) else 0.0
-        D_fire = D_fire_base * (1.0 + m_eln_fire)
-
-        # Total loss this year
-        D_total = D_human + D_fire
-
-        next_F = forest[-1] - D_total  # regeneration still 0 in V0.2
-        forest.append(max(next_F, 0.0))
-
-        D_human_series.append(D_human)
-        D_fire_series.append(D_fire)
+    years = years_arr.tolist()
+    forest = forest_arr.tolist()
+    D_human_series = D_human_arr.tolist()
+    D_fire_series = D_fire_arr.tolist()
 
     return years, forest, D_human_series, D_fire_series
 
 
 def first_crossing_year(years: List[int], forest: List[float], threshold_value: float) -> Optional[int]:
     """Returns first year where forest <= threshold_value; None if not crossed within horizon."""
-    for y, f in zip(years, forest):
-        if f <= threshold_value:
-            return y
-    return None
+    # With R=0 the forest series is non-increasing, so a binary search finds the first crossing
+    idx = int(np.searchsorted(-np.asarray(forest), -threshold_value, side="left"))
+    return years[idx] if idx < len(years) else None
 
 
 def main() -> None:
@@ -172,27 +165,27 @@ def main() -> None:
     # -----------------------------
     # Plot forest stock
     # -----------------------------
-    plt.figure(figsize=(11, 5))
+    fig = Figure(figsize=(11, 5))
+    ax = fig.add_subplot(111)
 
     for name, _, _, _ in scenarios:
         years, forest, _, _ = results[name]
-        plt.plot(years, forest, linewidth=2, label=name)
+        ax.plot(years, forest, linewidth=2, label=name)
 
     for label, frac in THRESHOLDS.items():
         thr = frac * F0
-        plt.axhline(thr, linestyle="--")
-        plt.text(START_YEAR + 1, thr, f"  {label}", va="bottom")
+        ax.axhline(thr, linestyle="--")
+        ax.text(START_YEAR + 1, thr, f"  {label}", va="bottom")
 
-    plt.title("Colombian Amazon — Forest Remaining (V0.2, Channelized Shocks, No Regeneration)")
-    plt.xlabel("Year")
-    plt.ylabel("Forest remaining (hectares)")
-    plt.grid(True, alpha=0.3)
-    plt.legend()
+    ax.set_title("Colombian Amazon — Forest Remaining (V0.2, Channelized Shocks, No Regeneration)")
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Forest remaining (hectares)")
+    ax.grid(True, alpha=0.3)
+    ax.legend()
 
     os.makedirs("outputs", exist_ok=True)
-    plt.tight_layout()
-    plt.savefig("outputs/forest_remaining_v0_2_channelized.png", dpi=200)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig("outputs/forest_remaining_v0_2_channelized.png", dpi=100)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,13 @@
 import os
-from typing import Dict, List, Optional, Set, Tuple
-import matplotlib.pyplot as plt
+from typing import List, Optional, Tuple
+from matplotlib.figure import Figure
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernel still runs as plain Python
+    def njit(*args, **kwargs):
+        return lambda fn: fn
 
 F0_TOTAL = 39_011_117
 F0_INTACT = F0_TOTAL
@@ -14,7 +21,7 @@ POST_ACCORD_START = 2017
 POST_ACCORD_MULT = 0.30
 
 FIRE_BASE = 20_000
-ELNINO_YEARS: Set[int] = {2015, 2016, 2023, 2024}
+ELNINO_YEARS = np.array([2015, 2016, 2023, 2024], dtype=np.int64)
 ELNINO_MULT = 0.20
 
 RHO_RECOVERY = 0.01
@@ -28,10 +35,88 @@ THRESHOLDS = {
 }
 
 def first_crossing_year(years: List[int], series: List[float], threshold_value: float) -> Optional[int]:
-    for y, v in zip(years, series):
-        if v <= threshold_value:
-            return y
-    return None
+    crossed = np.asarray(series) <= threshold_value
+    if not crossed.any():
+        return None
+    return years[int(np.argmax(crossed))]
+
+@njit(cache=True, fastmath=True)
+def _simulate_v03_kernel(
+    horizon,
+    F0_int,
+    F0_deg,
+    D_base,
+    enforcement_factor,
+    post_accord_on,
+    post_accord_start_offset,
+    post_accord_mult,
+    fire_base,
+    climate_stress,
+    alpha_vuln,
+    elnino_mask,
+    elnino_mult,
+    rho_recovery,
+    w_degraded_target,
+):
+    """
+    Numeric core of V0.3. Step t is year start_year + t, so the post-accord
+    regime applies from t >= post_accord_start_offset and El Niño applies
+    where elnino_mask[t] is True.
+
+    Returns a C-contiguous (horizon + 1, 3) state array with columns
+    (intact, degraded, total), so each step's values share a cache line.
+    """
+    state = np.empty((horizon + 1, 3))
+    state[0, 0] = F0_int
+    state[0, 1] = F0_deg
+    state[0, 2] = F0_int + F0_deg
+
+    F_int = F0_int
+    F_deg = F0_deg
+
+    # Loop-invariant setup: the post-accord toggle folds into its start step,
+    # so each step is a single int compare between two precomputed rates
+    post_start = post_accord_start_offset if post_accord_on else horizon + 1
+    D_pre = D_base * enforcement_factor
+    D_post = D_pre * (1.0 + post_accord_mult)
+    fire_scaled = fire_base * climate_stress
+
+    for t in range(horizon):
+        F_tot = max(F_int + F_deg, 1.0)
+
+        # Human conversion
+        D_human = D_post if t >= post_start else D_pre
+
+        # Allocate conversion pressure: small preference to degraded (but not enough to erase it)
+        convert_deg = min(F_deg, D_human * w_degraded_target)
+        remaining = D_human - convert_deg
+        convert_int = min(F_int, max(remaining, 0.0))
+
+        # Fire-driven degradation (reinforcing)
+        deg_share = F_deg / F_tot
+        vuln_factor = 1.0 + alpha_vuln * deg_share
+
+        eln = elnino_mult if elnino_mask[t] else 0.0
+        fire_pressure = fire_scaled * vuln_factor * (1.0 + eln)
+
+        # min of two non-negatives (convert_int <= F_int), so no extra clamp needed
+        degrade = min(F_int - convert_int, max(fire_pressure, 0.0))
+
+        # Recovery (balancing); convert_deg <= F_deg, so this is non-negative too
+        recover = min(F_deg - convert_deg, rho_recovery * F_deg)
+
+        next_int = F_int - convert_int - degrade + recover
+        next_deg = F_deg - convert_deg + degrade - recover
+
+        # Safety net against rounding below zero
+        next_tot = next_int + next_deg
+        F_int = next_int if next_int > 0.0 else 0.0
+        F_deg = next_deg if next_deg > 0.0 else 0.0
+        state[t + 1, 0] = F_int
+        state[t + 1, 1] = F_deg
+        state[t + 1, 2] = next_tot if next_tot > 0.0 else 0.0
+
+    return state
 
 def simulate_v03(
     start_year: int,
@@ -45,45 +130,99 @@ def simulate_v03(
 ) -> Tuple[List[int], List[float], List[float], List[float]]:
 
     years = [start_year + t for t in range(horizon + 1)]
-    intact = [float(F0_intact)]
-    degraded = [float(F0_degraded)]
-    total = [float(F0_intact + F0_degraded)]
+    elnino_mask = np.isin(years, ELNINO_YEARS)
+
+    state = _simulate_v03_kernel(
+        horizon,
+        float(F0_intact),
+        float(F0_degraded),
+        float(D_BASE),
+        float(enforcement_factor),
+        bool(post_accord_on),
+        POST_ACCORD_START - start_year,
+        float(POST_ACCORD_MULT),
+        float(FIRE_BASE),
+        float(climate_stress),
+        float(alpha_vuln),
+        elnino_mask,
+        float(ELNINO_MULT),
+        float(RHO_RECOVERY),
+        float(W_DEGRADED_TARGET),
+    )
+    intact, degraded, total = state.T
+
+    return years, intact.tolist(), degraded.tolist(), total.tolist()
+
+def simulate_v03_batch(
+    start_year: int,
+    horizon: int,
+    F0_intact: float,
+    F0_degraded: float,
+    post_accord_on: np.ndarray,
+    climate_stress: np.ndarray,
+    enforcement_factor: np.ndarray,
+    alpha_vuln: np.ndarray,
+) -> Tuple[List[int], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Same model as simulate_v03, but advances S scenarios together.
+    Scenario knobs are length-S arrays; returned stocks have shape (S, horizon + 1).
+    """
+    post_on = np.asarray(post_accord_on, dtype=np.bool_)
+    climate_stress = np.asarray(climate_stress, dtype=np.float64)
+    enforcement_factor = np.asarray(enforcement_factor, dtype=np.float64)
+    alpha_vuln = np.asarray(alpha_vuln, dtype=np.float64)
+    S = post_on.shape[0]
+
+    years = [start_year + t for t in range(horizon + 1)]
+    elnino_mask = np.isin(years, ELNINO_YEARS)
+
+    intact = np.empty((S, horizon + 1))
+    degraded = np.empty((S, horizon + 1))
+    total = np.empty((S, horizon + 1))
+    intact[:, 0] = F0_intact
+    degraded[:, 0] = F0_degraded
+    total[:, 0] = F0_intact + F0_degraded
+
+    F_int = np.full(S, float(F0_intact))
+    F_deg = np.full(S, float(F0_degraded))
+
+    D_scaled = D_BASE * enforcement_factor
+    fire_scaled = FIRE_BASE * climate_stress
 
     for t in range(horizon):
         y = years[t]
-        F_int = intact[-1]
-        F_deg = degraded[-1]
-        F_tot = max(F_int + F_deg, 1.0)
+        F_tot = np.maximum(F_int + F_deg, 1.0)
 
         # Human conversion
-        post_mult = POST_ACCORD_MULT if (post_accord_on and y >= POST_ACCORD_START) else 0.0
-        D_human = (D_BASE * enforcement_factor) * (1.0 + post_mult)
+        post_mult = np.where(post_on & (y >= POST_ACCORD_START), POST_ACCORD_MULT, 0.0)
+        D_human = D_scaled * (1.0 + post_mult)
 
         # Allocate conversion pressure: small preference to degraded (but not enough to erase it)
-        convert_deg = min(F_deg, D_human * W_DEGRADED_TARGET)
+        convert_deg = np.minimum(F_deg, D_human * W_DEGRADED_TARGET)
         remaining = D_human - convert_deg
-        convert_int = min(F_int, max(remaining, 0.0))
+        convert_int = np.minimum(F_int, np.maximum(remaining, 0.0))
 
         # Fire-driven degradation (reinforcing)
         deg_share = F_deg / F_tot
         vuln_factor = 1.0 + alpha_vuln * deg_share
 
-        eln = ELNINO_MULT if y in ELNINO_YEARS else 0.0
-        fire_pressure = (FIRE_BASE * climate_stress) * vuln_factor * (1.0 + eln)
+        eln = ELNINO_MULT if elnino_mask[t] else 0.0
+        fire_pressure = fire_scaled * vuln_factor * (1.0 + eln)
 
-        degrade = min(F_int - convert_int, max(fire_pressure, 0.0))
-        degrade = max(degrade, 0.0)
+        # min of two non-negatives (convert_int <= F_int), so no extra clamp needed
+        degrade = np.minimum(F_int - convert_int, np.maximum(fire_pressure, 0.0))
 
-        # Recovery (balancing)
-        recover = min(F_deg - convert_deg, RHO_RECOVERY * F_deg)
-        recover = max(recover, 0.0)
+        # Recovery (balancing); convert_deg <= F_deg, so this is non-negative too
+        recover = np.minimum(F_deg - convert_deg, RHO_RECOVERY * F_deg)
 
         next_int = F_int - convert_int - degrade + recover
         next_deg = F_deg - convert_deg + degrade - recover
 
-        intact.append(max(next_int, 0.0))
-        degraded.append(max(next_deg, 0.0))
-        total.append(max(next_int + next_deg, 0.0))
+        F_int = np.maximum(next_int, 0.0)
+        F_deg = np.maximum(next_deg, 0.0)
+        intact[:, t + 1] = F_int
+        degraded[:, t + 1] = F_deg
+        total[:, t + 1] = np.maximum(next_int + next_deg, 0.0)
 
     return years, intact, degraded, total
 
@@ -94,46 +233,42 @@ def main() -> None:
         ("Alt 2: Climate stress (higher fires + stronger feedback)", True, 1.7, 1.0, 4.0),
     ]
 
-    results: Dict[str, Tuple[List[int], List[float], List[float], List[float]]] = {}
-
-    for name, post_on, climate_stress, enforcement, alpha in scenarios:
-        years, intact, degraded, total = simulate_v03(
-            start_year=START_YEAR,
-            horizon=HORIZON_YEARS,
-            F0_intact=F0_INTACT,
-            F0_degraded=F0_DEGRADED,
-            post_accord_on=post_on,
-            climate_stress=climate_stress,
-            enforcement_factor=enforcement,
-            alpha_vuln=alpha,
-        )
-        results[name] = (years, intact, degraded, total)
+    # All scenarios share the same shape, so run them as lanes of one batched simulation
+    names, post_on, climate_stress, enforcement, alpha = zip(*scenarios)
+    years, intact, degraded, total = simulate_v03_batch(
+        start_year=START_YEAR,
+        horizon=HORIZON_YEARS,
+        F0_intact=F0_INTACT,
+        F0_degraded=F0_DEGRADED,
+        post_accord_on=np.array(post_on),
+        climate_stress=np.array(climate_stress),
+        enforcement_factor=np.array(enforcement),
+        alpha_vuln=np.array(alpha),
+    )
 
     print("\n=== Threshold Crossing Years (V0.3, total forest remaining) ===")
-    for name, *_ in scenarios:
-        years, _, _, total = results[name]
+    for i, name in enumerate(names):
         print(f"\nScenario: {name}")
         for label, frac in THRESHOLDS.items():
             thr = frac * F0_TOTAL
-            y_cross = first_crossing_year(years, total, thr)
+            y_cross = first_crossing_year(years, total[i], thr)
             print(f"  {label}: {y_cross if y_cross is not None else 'Not crossed within horizon'}")
 
-    plt.figure(figsize=(11, 5))
-    for name, *_ in scenarios:
-        years, intact, degraded, _ = results[name]
-        plt.plot(years, intact, linewidth=2, label=f"{name} — intact")
-        plt.plot(years, degraded, linewidth=2, linestyle="--", label=f"{name} — degraded")
+    fig = Figure(figsize=(11, 5))
+    ax = fig.add_subplot(111)
+    for i, name in enumerate(names):
+        ax.plot(years, intact[i], linewidth=2, label=f"{name} — intact")
+        ax.plot(years, degraded[i], linewidth=2, linestyle="--", label=f"{name} — degraded")
 
-    plt.title("Colombian Amazon — Intact vs Degraded Forest (V0.3)")
-    plt.xlabel("Year")
-    plt.ylabel("Area (hectares)")
-    plt.grid(True, alpha=0.3)
-    plt.legend()
+    ax.set_title("Colombian Amazon — Intact vs Degraded Forest (V0.3)")
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Area (hectares)")
+    ax.grid(True, alpha=0.3)
+    ax.legend()
 
     os.makedirs("outputs", exist_ok=True)
-    plt.tight_layout()
-    plt.savefig("outputs/forest_intact_degraded_v0_3.png", dpi=200)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig("outputs/forest_intact_degraded_v0_3.png", dpi=100)
 
 if __name__ == "__main__":
     main()